@@ -9,6 +9,11 @@ from .analyzer import analyzer
 from .cleaner import cleaner
 from .utils import utils
 
+# Bind the public functions directly on the package
+from .analyzer.analyzer import analyze_data
+from .cleaner.cleaner import clean_data
+from .utils.utils import process_data, validate_input
+
 # Expose only public function
 # __all__ = [
 #     'analyze_data',
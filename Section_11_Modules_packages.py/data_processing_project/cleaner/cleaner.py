@@ -1,13 +1,15 @@
 # data_processing/cleaner/cleaner.py
+import logging
+
+logger = logging.getLogger(__name__)
 
 def _remove_duplicates(data):
-    """Internal function to remove duplicates."""
-    print("Removing duplicates...")
-    return list(set(data))
+    """Internal function to remove duplicates (keeps the original order)."""
+    return list(dict.fromkeys(data))
 
 def clean_data(data):
     """Public function to clean data."""
-    print("Cleaning data...")
+    logger.debug("Cleaning data...")
     return _remove_duplicates(data)
 
-__all__ = [clean_data]
\ No newline at end of file
+__all__ = ['clean_data']
\ No newline at end of file
@@ -1,8 +1,11 @@
 # data_processing/utils/utils.py
+import logging
+
+logger = logging.getLogger(__name__)
 
 def _log_data(message):
     """Private function to log messages internally."""
-    print(f"[INTERNAL] {message}")
+    logger.debug("[INTERNAL] %s", message)
 
 def process_data(data):
     """Public function to process data."""
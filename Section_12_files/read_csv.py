@@ -1,24 +1,22 @@
 import csv
 
-# This approach is expensive and it uses arrays to find the data
-# with open('country.csv','r') as file:
-#     csv_reader = csv.reader(file)
-#     for index,val in enumerate(csv_reader):
-#         print(index,val)
-        
-    # to skip a line in csv use 
-    #next(csv_reader)
-
-#DictReader
-# this uses dictionary to map values
-# use same import csv
-fieldnames = ['country_name', 'area', 'code2', 'code3'] # to rename header of csv
-with open('country.csv','r') as file:
-    csv_reader = csv.DictReader(file)
-    for line in csv_reader:
-        print(line)
+# csv.reader gives each row as a plain list - no extra dict built per row
+# so it is the cheapest way to walk through a csv file
+with open('country.csv','r',newline='') as file:
+    csv_reader = csv.reader(file)
+    fieldnames = next(csv_reader) # read the header once, this also skips it
+    for index,row in enumerate(csv_reader):
+        print(index,row)
+        # need a dictionary? zip the saved header with the row
+        print(dict(zip(fieldnames,row)))
         break
-    
-
-
 
+#DictReader
+# this uses dictionary to map values, but it builds a new dict for every row
+# and also handles short/long rows (restkey/restval) which costs extra time
+# only use it when the rows may not be well formed
+# with open('country.csv','r') as file:
+#     csv_reader = csv.DictReader(file)
+#     for line in csv_reader:
+#         print(line)
+#         break
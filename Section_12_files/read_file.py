@@ -1,12 +1,21 @@
 #open a file and read it
 # use with to close file automatically
+import locale
+import mmap
+import os
 
 # Approach 1
 file = open('sample.txt')
 print(file.readline())
 file.close()
 
-# Approach 2
-with open('sample.txt') as file:
-    for line in file:
-        print(line.strip())
\ No newline at end of file
+# Approach 2 - mmap maps the file into memory, good for scanning large files
+# lines come back as bytes so decode them with the same encoding open() uses
+encoding = locale.getpreferredencoding(False)
+with open('sample.txt','rb') as file:
+    if os.fstat(file.fileno()).st_size: # an empty file can't be mapped
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, 'madvise'):
+                mm.madvise(mmap.MADV_SEQUENTIAL) # tell the OS we read front to back
+            for line in iter(mm.readline, b''):
+                print(line.decode(encoding).strip())
\ No newline at end of file
@@ -1,17 +1,21 @@
 import os
 
-file = os.path.exists('test.txt')
-if not file:
+# 'x' only creates a new file, so no need to check if it exists first
+try:
     with open('test.txt','x') as file:
         print("File is created")
         file.write("Success")
+except FileExistsError:
+    pass
 
 with open('test.txt','r') as file:
         for line in file:
             print(line)
 
-file = os.path.exists('test.txt')
-if file:
-    print('File removed')
-    os.remove('test.txt')
-    os.remove('sample.txt')
\ No newline at end of file
+# just try to remove, a missing file raises FileNotFoundError
+for path in ('test.txt', 'sample.txt'):
+    try:
+        os.unlink(path)
+        print(f'File removed -> {path}')
+    except FileNotFoundError:
+        pass
@@ -1,14 +1,20 @@
 import os
 
-file = os.path.exists('test.txt')
-if not file:
+# 'x' only creates a new file, so no need to check if it exists first
+try:
     with open('test.txt','x') as file:
         print("File is created")
         file.write("Success")
+except FileExistsError:
+    pass
 
 with open('test.txt','r') as file:
         for line in file:
             print(line)
 
-print('File Renamed to sample')
-os.rename('test.txt','sample.txt')
\ No newline at end of file
+# os.replace overwrites sample.txt if it is already there
+try:
+    os.replace('test.txt','sample.txt')
+    print('File Renamed to sample')
+except FileNotFoundError:
+    print('test.txt not found')
\ No newline at end of file
@@ -1,23 +1,35 @@
 import csv
-from os.path import exists
 
 header = ['name', 'area', 'country_code2', 'country_code3']
 data = ['Afghanistan', 652090, 'AF', 'AFG']
-if not exists('countries.csv'):
-    file = open('countries.csv','x')
-    print("File Created")
-    file.close()
-
+# 'w' creates the file if it is missing and empties it if it exists
 file = open('countries.csv','w',newline='') # newline='' is added to eliminate new line
 writer = csv.writer(file)
-writer.writerow(header)
-writer.writerow(data)    
+writer.writerows([header, data]) # one call writes every row
 file.close()
 
 
 #Writing to CSV files using the DictWriter class
 
 from pathlib import Path
+from operator import itemgetter
+
+# DictWriter looks up every key with .get() for every row
+# when a row has exactly the fieldnames, itemgetter grabs the values in one call
+# any other row (missing or extra keys) goes through DictWriter's own handling,
+# so restval and extrasaction keep working as usual
+class FastDictWriter(csv.DictWriter):
+    def __init__(self, f, fieldnames, *args, **kwargs):
+        super().__init__(f, fieldnames, *args, **kwargs)
+        self._fieldset = frozenset(self.fieldnames)
+        # itemgetter needs at least 2 names to return a tuple
+        self._getter = itemgetter(*self.fieldnames) if len(self.fieldnames) > 1 else None
+
+    def _dict_to_list(self, rowdict):
+        if (self._getter is not None and len(rowdict) == len(self._fieldset)
+                and self._fieldset.issuperset(rowdict)):
+            return self._getter(rowdict)
+        return super()._dict_to_list(rowdict)
 
 # csv header
 fieldnames = ['name', 'area', 'country_code2', 'country_code3']
@@ -44,12 +56,8 @@ rows = [
             'country_code3': 'ASM'
         }
 ]
-if not file_name.is_file():
-    file = open('country_dict.csv', 'x')
-    print("File Created")
-    file.close()
-    
-with open('country_dict.csv', 'w', encoding='UTF8', newline='') as f:
-    writer = csv.DictWriter(f,fieldnames=fieldnames)
+
+with open(file_name, 'w', encoding='UTF8', newline='') as f:
+    writer = FastDictWriter(f,fieldnames=fieldnames)
     writer.writeheader() # if not used then CSV doesnt have header
     writer.writerows(rows)
\ No newline at end of file
@@ -1,13 +1,12 @@
 #open a file and write it
 # use with to close file automatically
+from pathlib import Path
 
-# Approach 1 - Manually close the file
+# Approach 1 - Path.write_text opens, writes and closes the file for you
 lines = ['Readme', '\nHow to write text files in Python']
-file = open('sample.txt','w')
-file.writelines(lines)
-file.close()
+Path('sample.txt').write_text(''.join(lines)) # join first so there is a single write
 
 # Approach 2 - use with to Auto close the file
 words = ['\nReadme', '\nHow to write text files in Python']
-with open('sample.txt','a') as file:
-    file.writelines(words)
\ No newline at end of file
+with Path('sample.txt').open('a') as file:
+    file.write(''.join(words))
\ No newline at end of file
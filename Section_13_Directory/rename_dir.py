@@ -3,13 +3,22 @@ import os
 # to work on this you need to create old path folder
 
 old_path = os.path.join('Section_dir')
-if not os.path.exists(old_path) or os.path.isdir(old_path):
-    os.mkdir(old_path)
+try:
+    os.mkdir(old_path) # fails if it already exists, no need to check first
     print(f"The Folder Created -> {old_path}")
+except FileExistsError:
+    print(f"The Folder Exist -> {old_path}")
 
 new_path = os.path.join('Section_new_dir')
 
-if os.path.exists(old_path) and not os.path.isdir(new_path):
-    os.rename(old_path,new_path)
-    print(f"Folder Renamed -> {new_path}")
-    print(f"Folder old path check -> {os.path.exists(os.path.join('Section_dir'))}")
\ No newline at end of file
+# On Linux/macOS os.rename (like os.replace) silently replaces an empty new_path,
+# so skip the rename when new_path already exists to keep it untouched
+if os.path.exists(new_path):
+    print(f"Folder already exists, rename skipped -> {new_path}")
+else:
+    try:
+        os.rename(old_path,new_path)
+        print(f"Folder Renamed -> {new_path}")
+        print(f"Folder old path check -> {os.path.exists(os.path.join('Section_dir'))}")
+    except OSError as e:
+        print(f"Folder not renamed -> {e}")
@@ -1,6 +1,7 @@
 class Smartphone: # Class Creation
     
     Counter = 0 #class Attribute. It can be access all classes
+    __slots__ = ('model', 'type') # only these instance attributes are allowed
     
     def __init__(self,model,type):
         # Two attributes are accessed across all class instance
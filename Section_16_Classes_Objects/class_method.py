@@ -1,5 +1,6 @@
 class Student:
     total_students = 0  # class-level attribute
+    __slots__ = ('name',)  # instances only store name, no __dict__
 
     def __init__(self, name):
         self.name = name  # instance-level attribute
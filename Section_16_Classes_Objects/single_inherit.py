@@ -1,4 +1,5 @@
 class Student:
+    __slots__ = ('name', 'age') # fixed attributes, no per-instance __dict__
     
     def __init__(self, name,age):
         self.name = name
@@ -8,13 +9,15 @@ class Student:
         return f"Student Name is |{self.name}|\nStudent age is |{self.age}|\n"
     
 class Course(Student):
+    __slots__ = ('course',) # only the new attribute, name and age come from Student
     
     def __init__(self,name,age,course):
         super().__init__(name,age)
         self.course = course
     
     def greet(self):
-        return super().greet() + f"Student Enrolled in |{self.course}|"
+        # single inheritance, so call the parent directly - no super() proxy to build
+        return Student.greet(self) + f"Student Enrolled in |{self.course}|"
     
 print(Course.__mro__)
 # student1 = Course("Alice",25,"Computer Science")
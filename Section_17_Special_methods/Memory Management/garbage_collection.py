@@ -1,5 +1,6 @@
 import gc
 import ctypes
+import weakref
 from colorama import Fore, Back, Style, init
 
 # Initialize colorama
@@ -11,45 +12,53 @@ WARNING = Fore.YELLOW + Style.BRIGHT
 SUCCESS = Fore.GREEN + Style.BRIGHT
 ERROR = Fore.RED + Style.BRIGHT
 RESET = Style.RESET_ALL
+WARNING_PREFIX = WARNING + "[!]"
+SUCCESS_PREFIX = SUCCESS + "[+]"
+SECTION_PREFIX = Fore.BLUE + "\n[ CYBER-SECTION ] " + WARNING
 
 # Helper Functions
 def ref_count(address):
     return ctypes.c_long.from_address(address).value
 
-def object_exists(object_id):
-    for obj in gc.get_objects():
-        if id(obj) == object_id:
-            return True
-    return False
+def object_exists(object_ref):
+    # a weakref returns None once its object is freed - no need to scan gc.get_objects()
+    return object_ref() is not None
 
-# Fancy header with ASCII Art
-def cyber_header(text):
-    print(Fore.BLUE + """
+# Fancy header with ASCII Art (colored once at import)
+BANNER = Fore.BLUE + """
     ██████╗ ███╗   ██╗██╗   ██╗██╗  ██╗
     ██╔═══██╗████╗  ██║╚██╗ ██╔╝╚██╗██╔╝
     ██║   ██║██╔██╗ ██║ ╚████╔╝  ╚███╔╝ 
     ██║   ██║██║╚██╗██║  ╚██╔╝   ██╔██╗ 
     ╚██████╔╝██║ ╚████║   ██║   ██╔╝ ██╗
     ╚═════╝ ╚═╝  ╚═══╝   ╚═╝   ╚═╝  ╚═╝
-    """ + RESET)
+    """ + RESET
+
+def cyber_header(text):
+    print(BANNER)
     print(CYBER + f"{'=' * 40}")
     print(f"{text.center(40)}")
     print('=' * 40 + RESET)
 
 # Print section headers
 def cyber_section(title):
-    print(Fore.BLUE + "\n[ CYBER-SECTION ] " + WARNING + title)
+    print(SECTION_PREFIX, title, sep="")
 
 # Classes
 class ParentObject:
+    __slots__ = ('child', '__weakref__')  # __weakref__ keeps weakref.ref() working
+
     def __init__(self):
         self.child = ChildObject(self)
         print(f"ParentObject {id(self)} | ChildObject {id(self.child)}")
 
 class ChildObject:
+    __slots__ = ('parent', '__weakref__')
+
     def __init__(self, parent):
-        self.parent = parent
-        print(f"ParentObject {id(self.parent)} | ChildObject {id(self)}")
+        # weak reference back to the parent - no cycle, so refcounting alone frees both
+        self.parent = weakref.ref(parent)
+        print(f"ParentObject {id(self.parent())} | ChildObject {id(self)}")
 
 # Main Script
 gc.disable()
@@ -57,7 +66,7 @@ gc.disable()
 cyber_header("Garbage Collection Hacker Mode 🧹💻")
 
 cyber_section("GC Status")
-print(WARNING + "[!] Garbage Collector: Disabled")
+print(WARNING_PREFIX, "Garbage Collector: Disabled")
 
 cyber_section("Creating Objects 🎉")
 
@@ -67,7 +76,11 @@ parent_instance = ParentObject()  # This is effectively our 'parent_object'
 # Save memory addresses
 parent_id = id(parent_instance)                     # Address of parent_object
 child_id = id(parent_instance.child)                 # Address of child
-child_parent_id = id(parent_instance.child.parent)    # Should match parent_id
+child_parent_id = id(parent_instance.child.parent())  # Should match parent_id
+
+# Weak references used to check if the objects are still alive
+parent_ref = weakref.ref(parent_instance)
+child_ref = weakref.ref(parent_instance.child)
 
 cyber_section("Saved Memory Addresses 🧠")
 print(SUCCESS + f"ParentObject ID   : {parent_id}")
@@ -75,8 +88,8 @@ print(f"ChildObject ID    : {child_id}")
 print(f"Child's Parent ID : {child_parent_id}")
 
 cyber_section("GC Check (Before) 🔍")
-print(f"ParentObject exists: {object_exists(parent_id)}")
-print(f"ChildObject exists : {object_exists(child_id)}")
+print(f"ParentObject exists: {object_exists(parent_ref)}")
+print(f"ChildObject exists : {object_exists(child_ref)}")
 
 cyber_section("Reference Counts (Initial) 📊")
 print(f"ParentObject RefCount: {ref_count(parent_id)}")
@@ -84,29 +97,31 @@ print(f"ChildObject RefCount : {ref_count(child_id)}")
 
 cyber_section("Removing External Reference 🚫")
 parent_instance = None  # Simulate deletion of external reference to parent_object
-print(WARNING + "[!] parent_instance = None — external link removed")
+print(WARNING_PREFIX, "parent_instance = None — external link removed, objects freed")
 
 cyber_section("Ref Count After Removal 📉")
-print(f"ParentObject: {ref_count(parent_id)}")
-print(f"ChildObject : {ref_count(child_id)}")
+# only read the ref count while the object is alive, freed memory holds leftovers
+print(f"ParentObject: {ref_count(parent_id) if object_exists(parent_ref) else 'freed'}")
+print(f"ChildObject : {ref_count(child_id) if object_exists(child_ref) else 'freed'}")
 
 cyber_section("GC Check (After p = None) 🕵️")
-print(f"ParentObject: {object_exists(parent_id)}")
-print(f"ChildObject : {object_exists(child_id)}")
+print(f"ParentObject: {object_exists(parent_ref)}")
+print(f"ChildObject : {object_exists(child_ref)}")
 
-cyber_section("Running GC — Cleaning Up Cycles 🧹")
+cyber_section("Running GC — Nothing Left To Clean 🧹")
 collected = gc.collect()
-print(SUCCESS + f"[+] Collected {collected} objects")
+print(SUCCESS_PREFIX, f"Collected {collected} objects")
 
 cyber_section("GC Check (After GC Run) ✅")
-print(f"ParentObject: {object_exists(parent_id)}")
-print(f"ChildObject : {object_exists(child_id)}")
+print(f"ParentObject: {object_exists(parent_ref)}")
+print(f"ChildObject : {object_exists(child_ref)}")
 
 cyber_section("Final Ref Counts 🔍")
-try:
+# reading the ref count of a freed object only returns leftover memory
+if object_exists(parent_ref) and object_exists(child_ref):
     print(ERROR + "ParentObject:", ref_count(parent_id))
     print("ChildObject :", ref_count(child_id))
-except:
-    print(ERROR + "Reference no longer valid (freed by GC)")
+else:
+    print(ERROR + "Reference no longer valid (objects freed)")
 
 cyber_header("Memory Cleanup Complete 🛡️✅")
\ No newline at end of file
@@ -9,9 +9,10 @@ WARNING = Fore.YELLOW + Style.BRIGHT
 SUCCESS = Fore.GREEN + Style.BRIGHT
 ERROR = Fore.RED + Style.BRIGHT
 RESET = Style.RESET_ALL
+SECTION_PREFIX = Fore.BLUE + "\n[ CYBER-SECTION ] " + WARNING
 
 def cyber_section(title):
-    print(Fore.BLUE + "\n[ CYBER-SECTION ] " + WARNING + title)
+    print(SECTION_PREFIX, title, sep="")
 
 # =============================
 # Why Use Property in Python?
@@ -34,17 +35,23 @@ header = """
      ╚═════╝ ╚═╝  ╚═══╝   ╚═╝   ╚═╝  ╚═╝
     """
 
-print(CYBER + header)
-print(CYBER + "=" * 40)
-print(" PROPERTY EVOLUTION DEMO ".center(40))
-print(f"by {ERROR +'@Onyxwizard'+ RESET}".center(50))
-print(CYBER+ "=" * 40 + RESET)
+# Build the colored banner once and print it in one call
+BANNER = "\n".join([
+    CYBER + header,
+    CYBER + "=" * 40,
+    " PROPERTY EVOLUTION DEMO ".center(40),
+    f"by {ERROR +'@Onyxwizard'+ RESET}".center(50),
+    CYBER + "=" * 40 + RESET,
+])
+print(BANNER)
 
 # -----------------------------
 # 1. Employee: Basic Version (No Validation)
 # -----------------------------
 cyber_section("🧱 Class: Employee (No Validation)")
 class Employee:
+    __slots__ = ('name', 'age')
+
     def __init__(self, name, age):
         self.name = name
         self.age = age
@@ -62,6 +69,8 @@ print(WARNING + "⚠️  WARNING: Anyone can assign invalid data!")
 # -----------------------------
 cyber_section("🔧 Class: Employee1 (Init-time Validation)")
 class Employee1:
+    __slots__ = ('name', 'age')
+
     def __init__(self, name, age):
         self.name = name
         self.age = self.set_age(age)
@@ -88,6 +97,8 @@ print(WARNING + "⚠️  INFO: Only validates during __init__")
 # -----------------------------
 cyber_section("⚙️  Class: Employee2 (Manual Getter/Setter)")
 class Employee2:
+    __slots__ = ('_name', '_age')
+
     def __init__(self, name, age):
         self._name = name
         self._age = age
@@ -104,10 +115,10 @@ class Employee2:
         return self._age
 
     def set_age(self, value):
-        if not isinstance(value, (int, float)):
+        if not isinstance(value, (int, float)):  # ints and floats are kept as they are
             try:
                 value = int(value)
-            except:
+            except (TypeError, ValueError):
                 raise TypeError(f"Age must be numeric, got {type(value)}")
         if value < 0:
             raise ValueError("Age must be positive")
@@ -126,6 +137,8 @@ print(WARNING + "⚠️  CAUTION: Direct access still possible")
 # -----------------------------
 cyber_section("⚡  Class: Employee3 (property() Function)")
 class Employee3:
+    __slots__ = ('_name', '_age')
+
     def __init__(self, name, age):
         self._name = name
         self._age = age
@@ -142,10 +155,10 @@ class Employee3:
         return self._age
 
     def set_age(self, value):
-        if not isinstance(value, (int, float)):
+        if not isinstance(value, (int, float)):  # ints and floats are kept as they are
             try:
                 value = int(value)
-            except:
+            except (TypeError, ValueError):
                 raise TypeError(f"Age must be numeric, got {type(value)}")
         if value < 0:
             raise ValueError("Age must be positive")
@@ -171,6 +184,8 @@ except Exception as e:
 # -----------------------------
 cyber_section("🚀  Class: Employee4 (@property)")
 class Employee4:
+    __slots__ = ('_name', '_age')
+
     def __init__(self, name, age):
         self.name = name
         self.age = age
@@ -193,10 +208,10 @@ class Employee4:
 
     @age.setter
     def age(self, value):
-        if not isinstance(value, (int, float)):
+        if not isinstance(value, (int, float)):  # ints and floats are kept as they are
             try:
                 value = int(value)
-            except:
+            except (TypeError, ValueError):
                 raise TypeError(f"Age must be numeric, got {type(value)}")
         if value < 0:
             raise ValueError("Age must be a positive number")